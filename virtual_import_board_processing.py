@@ -1,8 +1,233 @@
 # Written by Felix Kahle, A123234, felix.kahle@worldcourier.de
 
-from typing import Set
+import functools
+import logging
+import os
+import re
 import pandas as pd
 
+try:
+    import pyarrow
+    _STRING_DTYPE = "string[pyarrow]"
+    _ARROW_STRING_DTYPE = pd.ArrowDtype(pyarrow.string())
+except ImportError:
+    _STRING_DTYPE = "string"
+    _ARROW_STRING_DTYPE = None
+
+logger = logging.getLogger(__name__)
+
+# The columns of the MAWB xls file that are needed to build the virtual import board, mapped to their new names.
+# Only these columns are loaded from the file, in the order they appear in the processed dataframe.
+_MAWB_RENAME = {
+    "Ref: MAWB": "MAWB",
+    "Ref: Job Number": "Job Number",
+    "Carrier Rate Carrier Name": "Airline Name",
+    "Ref: Flight Arrival": "Flight Arrival",
+    "Shipper City": "Shipper Airport City",
+    "Shipper State": "Shipper Airport State",
+    "Shipper Postal Code": "Shipper Airport Postal Code",
+    "Target Delivery (Early)": "Target Delivery Airport",
+    "Consignee Name": "Consignee Airport Name",
+    "Consignee City": "Consignee Airport City",
+    "Consignee State": "Consignee Airport State",
+    "Consignee Country": "Consignee Airport Country",
+}
+_MAWB_USECOLS = tuple(_MAWB_RENAME)
+
+# The columns of the Shipper Site xls file that are needed to build the virtual import board, mapped to their new names.
+_SHIPPER_SITE_RENAME = {
+    "Load #": "Job Number",
+    "Ref: House Waybill Number": "House Waybill Number",
+    "Ref: Temperature Range": "Temperature Range",
+    "ActPlan: Act Plan: Qualification Time": "Qualification Time",
+    "Actual Ship Unit Quantity": "Ship Unit Quantity",
+    "Actual Ship Unit Weight": "Ship Unit Weight",
+    "Target Delivery (Range)": "Target Delivery Consignee",
+    "Consignee City": "Consignee City",
+}
+_SHIPPER_SITE_USECOLS = tuple(_SHIPPER_SITE_RENAME)
+
+# Multiple Job Numbers in the MAWB file are separated by a comma and optional whitespace.
+_JOB_NUMBER_SPLIT = re.compile(r"\s*,\s*")
+
+# The text columns are loaded as Arrow backed strings if pyarrow is available.
+# This lets the .str methods run on Arrow compute kernels instead of looping over Python objects.
+# The columns below are always loaded as strings, even if their cells look like numbers.
+# All other columns that only contain text are converted after loading.
+_MAWB_STRING_DTYPES = {
+    column: _STRING_DTYPE
+    for column in (
+        "Ref: MAWB",
+        "Ref: Job Number",
+        "Carrier Rate Carrier Name",
+        "Shipper City",
+        "Shipper State",
+        "Consignee Name",
+        "Consignee City",
+        "Consignee State",
+    )
+}
+
+_SHIPPER_SITE_STRING_DTYPES = {
+    column: _STRING_DTYPE
+    for column in (
+        "Load #",
+        "Consignee City",
+    )
+}
+
+# All valid MAWB files contain the following columns
+_MAWB_COLUMNS = frozenset([
+    "Create Date",
+    "Create By",
+    "Owner",
+    "Load #",
+    "Status",
+    "Ref: MAWB",
+    "Ref: Job Number",
+    "Carrier Rate Carrier Name",
+    "Ref: Flight Arrival",
+    "Actual Ship Unit Quantity",
+    "Actual Ship Unit Weight",
+    "Ship Unit UOM (Actual Weight)",
+    "Carrier Rate",
+    "Target Ship (Early)",
+    "Actual Ship Date",
+    "Shipper Name",
+    "Shipper Address",
+    "Shipper City",
+    "Shipper State",
+    "Shipper Postal Code",
+    "Shipper Country",
+    "Target Delivery (Early)",
+    "Actual Delivery Date",
+    "Consignee Name",
+    "Consignee Address",
+    "Consignee City",
+    "Consignee State",
+    "Consignee Postal Code",
+    "Consignee Country",
+    "ActStat: Act Stat: Set Booking Status",
+    "ActStat: Act Stat: Confirm PostFlight",
+    "ActStat: Act Stat: Confirm Transfer 1",
+    "ActStat: Act Stat: Confirm Transfer 2",
+    "ActStat: Act Stat: Confirm Consignment Arr",
+])
+
+# All valid Shipper Site files contain the following columns
+_SHIPPER_SITE_COLUMNS = frozenset([
+    "Create Date",
+    "Create By",
+    "Owner",
+    "BillTo Code",
+    "BillTo Name",
+    "Load #",
+    "Ref: House Waybill Number",
+    "Ref: Temperature Range",
+    "ActStat: Act Stat: RecoverTM",
+    "ActPlan: Act Plan: Qualification Time",
+    "Status",
+    "Actual Ship Unit Quantity",
+    "Actual Ship Unit Weight",
+    "Ship Unit UOM (Actual Weight)",
+    "Target Ship (Range)",
+    "Actual Ship Date",
+    "Ref: Shipper Site",
+    "Shipper Name",
+    "Shipper City",
+    "Shipper State",
+    "Shipper Country",
+    "Target Delivery (Range)",
+    "Actual Delivery Date",
+    "ActPlan: Act Plan: Delivery Expiration",
+    "Consignee Name",
+    "Consignee City",
+    "Consignee State",
+    "Consignee Country",
+    "ActStat: Act Stat: Gather Replenishment Details",
+    "ActDate: Act Date: Gather Replenishment Details",
+])
+
+# Read the workbooks with the Rust based calamine engine if it is available, as it is much faster than openpyxl.
+# pandas supports the calamine engine since version 2.2.
+try:
+    import python_calamine  # noqa: F401
+    _USE_CALAMINE = tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+except ImportError:
+    _USE_CALAMINE = False
+
+def _has_text_dtype(column: pd.Series) -> bool:
+    """
+    Checks if the given column can be processed with the .str accessor.
+    Columns without any text, like an empty column that was loaded as float64, are not.
+
+    Parameters
+    ----------
+    column:
+        The column to check
+
+    Returns
+    -------
+    bool:
+        True if the column has a string or object dtype, False otherwise.
+    """
+    return isinstance(column.dtype, pd.StringDtype) or pd.api.types.is_object_dtype(column.dtype)
+
+def _title_case(column: pd.Series) -> pd.Series:
+    """
+    Capitalizes the first letter of each word in the given column.
+    Values that are not strings are returned unchanged.
+
+    Parameters
+    ----------
+    column:
+        The column to capitalize
+
+    Returns
+    -------
+    pd.Series:
+        The capitalized column.
+    """
+    if not _has_text_dtype(column):
+        return column
+
+    titled = column.str.title()
+    if pd.api.types.is_object_dtype(column.dtype):
+        # str.title() turns values that are not strings into NaN, so restore them.
+        titled = titled.where(titled.notna(), column)
+    return titled
+
+def _parse_dates(column: pd.Series, date_format: str) -> pd.Series:
+    """
+    Parses the text values of the given column as dates in the given format.
+    Values that Excel already stored as dates are kept, and columns without any text are returned unchanged.
+
+    Parameters
+    ----------
+    column:
+        The column to parse
+
+    date_format:
+        The format of the dates stored as text
+
+    Returns
+    -------
+    pd.Series:
+        The parsed column.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column.dtype) or not _has_text_dtype(column):
+        return column
+
+    # str.strip() yields NaN for values that are not strings, which marks the cells stored as text.
+    stripped = column.str.strip()
+    is_text = stripped.notna()
+    parsed = pd.to_datetime(stripped, format=date_format, errors="coerce")
+    if (is_text | column.isna()).all():
+        return parsed
+
+    # The column mixes dates stored as text with actual dates, so keep the latter.
+    return pd.to_datetime(parsed.astype(object).where(is_text, column))
+
 def is_mawb_dataframe(df: pd.DataFrame) -> bool:
     """
     Checks if the given dataframe is a valid MAWB dataframe.
@@ -17,46 +242,11 @@ def is_mawb_dataframe(df: pd.DataFrame) -> bool:
     bool:
         True if the dataframe is a valid MAWB dataframe, False otherwise.
     """
-
-    # All valid MAWB files contain the following columns
-    mawb_columns = [
-        "Create Date",
-        "Create By",
-        "Owner",
-        "Load #",
-        "Status",
-        "Ref: MAWB",
-        "Ref: Job Number",
-        "Carrier Rate Carrier Name",
-        "Ref: Flight Arrival",
-        "Actual Ship Unit Quantity",
-        "Actual Ship Unit Weight",
-        "Ship Unit UOM (Actual Weight)",
-        "Carrier Rate",
-        "Target Ship (Early)",
-        "Actual Ship Date",
-        "Shipper Name",
-        "Shipper Address",
-        "Shipper City",
-        "Shipper State",
-        "Shipper Postal Code",
-        "Shipper Country",
-        "Target Delivery (Early)",
-        "Actual Delivery Date",
-        "Consignee Name",
-        "Consignee Address",
-        "Consignee City",
-        "Consignee State",
-        "Consignee Postal Code",
-        "Consignee Country",
-        "ActStat: Act Stat: Set Booking Status",
-        "ActStat: Act Stat: Confirm PostFlight",
-        "ActStat: Act Stat: Confirm Transfer 1",
-        "ActStat: Act Stat: Confirm Transfer 2",
-        "ActStat: Act Stat: Confirm Consignment Arr",
-    ]
-
-    return set(df.columns) == set(mawb_columns)
+    # Only build the set of column names if the number of columns matches
+    columns = df.columns
+    if len(columns) != len(_MAWB_COLUMNS):
+        return False
+    return _MAWB_COLUMNS == set(columns)
 
 def is_shipper_site_dataframe(df: pd.DataFrame) -> bool:
     """
@@ -72,41 +262,80 @@ def is_shipper_site_dataframe(df: pd.DataFrame) -> bool:
     bool:
         True if the dataframe is a valid Shipper Site dataframe, False otherwise.
     """
+    # Only build the set of column names if the number of columns matches
+    columns = df.columns
+    if len(columns) != len(_SHIPPER_SITE_COLUMNS):
+        return False
+    return _SHIPPER_SITE_COLUMNS == set(columns)
 
-    shipper_site_columns = [
-        "Create Date",
-        "Create By",
-        "Owner",
-        "BillTo Code",
-        "BillTo Name",
-        "Load #",
-        "Ref: House Waybill Number",
-        "Ref: Temperature Range",
-        "ActStat: Act Stat: RecoverTM",
-        "ActPlan: Act Plan: Qualification Time",
-        "Status",
-        "Actual Ship Unit Quantity",
-        "Actual Ship Unit Weight",
-        "Ship Unit UOM (Actual Weight)",
-        "Target Ship (Range)",
-        "Actual Ship Date",
-        "Ref: Shipper Site",
-        "Shipper Name",
-        "Shipper City",
-        "Shipper State",
-        "Shipper Country",
-        "Target Delivery (Range)",
-        "Actual Delivery Date",
-        "ActPlan: Act Plan: Delivery Expiration",
-        "Consignee Name",
-        "Consignee City",
-        "Consignee State",
-        "Consignee Country",
-        "ActStat: Act Stat: Gather Replenishment Details",
-        "ActDate: Act Date: Gather Replenishment Details",
-    ]
+def _excel_engine_options(file) -> dict:
+    """
+    Returns the keyword arguments that select the engine pd.read_excel uses for the given file.
+
+    Parameters
+    ----------
+    file:
+        The xls file
+
+    Returns
+    -------
+    dict:
+        The engine keyword arguments for pd.read_excel.
+    """
+    if _USE_CALAMINE:
+        return {"engine": "calamine"}
+
+    # Only .xlsx files can be read by openpyxl. For all other files, like the old binary .xls format,
+    # pandas picks the engine itself.
+    name = file if isinstance(file, (str, os.PathLike)) else getattr(file, "name", "")
+    if str(name).lower().endswith((".xlsx", ".xlsm")):
+        return {"engine": "openpyxl"}
+    return {}
+
+def _read_excel_columns(file, file_columns: frozenset, usecols: tuple, dtype: dict, file_kind: str) -> pd.DataFrame:
+    """
+    Reads the given columns of the xls file into a pandas dataframe and returns it.
+    The header of the file is checked against all columns the file must contain before the columns are read.
+
+    Parameters
+    ----------
+    file:
+        The xls file
+
+    file_columns:
+        All columns the xls file must contain
+
+    usecols:
+        The columns to read
 
-    return set(df.columns) == set(shipper_site_columns)
+    dtype:
+        The dtypes of the columns that should not be inferred
+
+    file_kind:
+        The kind of the xls file, used in the error message
+
+    Returns
+    -------
+    pd.DataFrame:
+        The given columns of the xls file as a pandas dataframe.
+
+    Raises
+    ------
+    ValueError:
+        If the columns of the xls file do not match the given file columns.
+    """
+    # Open the workbook once and parse the header first, as only the needed columns are read afterwards.
+    with pd.ExcelFile(file, **_excel_engine_options(file)) as excel_file:
+        columns = excel_file.parse(nrows=0).columns
+        if len(columns) != len(file_columns) or file_columns != set(columns):
+            raise ValueError(f"The file is not a valid {file_kind} file.")
+        df = excel_file.parse(usecols=list(usecols), dtype=dtype)
+
+    # Use the same string dtype for all text columns, so missing values are represented the same way.
+    for column in df.columns:
+        if column not in dtype and pd.api.types.infer_dtype(df[column], skipna=True) == "string":
+            df[column] = df[column].astype(_STRING_DTYPE)
+    return df
 
 def load_mawb_dataframe(mawb_file) -> pd.DataFrame:
     """
@@ -121,15 +350,60 @@ def load_mawb_dataframe(mawb_file) -> pd.DataFrame:
     -------
     pd.DataFrame:
         The MAWB xls file as a pandas dataframe.
+
+    Raises
+    ------
+    ValueError:
+        If the file is not a valid MAWB file.
     """
 
+    mawb_df = _read_excel_columns(mawb_file, _MAWB_COLUMNS, _MAWB_USECOLS, _MAWB_STRING_DTYPES, "MAWB")
+
     # The MAWB xls file contains a column "Target Delivery (Early)" that contains dates in the format "mm/dd/yyyy hh:mm".
-    date_parser = lambda x: pd.to_datetime(x.strip(), format='%m/%d/%Y %H:%M')
-    return pd.read_excel(mawb_file, dtype={"Ref: MAWB": str}, parse_dates=["Target Delivery (Early)"], date_format=date_parser)
+    # Parse the whole column at once with an explicit format so pandas can use its vectorized parser.
+    if "Target Delivery (Early)" in mawb_df:
+        mawb_df["Target Delivery (Early)"] = _parse_dates(mawb_df["Target Delivery (Early)"], "%m/%d/%Y %H:%M")
+    return mawb_df
+
+# Each cached entry holds a complete Shipper Site dataframe for the lifetime of the process,
+# so only the most recently loaded files are kept.
+@functools.lru_cache(maxsize=2)
+def _read_shipper_site_file(shipper_site_path: str, inode: int, size: int, modified_time_ns: int) -> pd.DataFrame:
+    """
+    Reads the Shipper Site xls file at the given path into a pandas dataframe and returns it.
+    The result is cached per path, inode, size and modification time, so the same file is only read once
+    as long as it is not changed or replaced.
+
+    Parameters
+    ----------
+    shipper_site_path:
+        The absolute path of the Shipper Site file
+
+    inode:
+        The inode number of the Shipper Site file
+
+    size:
+        The size of the Shipper Site file in bytes
+
+    modified_time_ns:
+        The modification time of the Shipper Site file in nanoseconds
+
+    Returns
+    -------
+    pd.DataFrame:
+        The Shipper Site xls file as a pandas dataframe.
+    """
+    return _read_excel_columns(
+        shipper_site_path, _SHIPPER_SITE_COLUMNS, _SHIPPER_SITE_USECOLS, _SHIPPER_SITE_STRING_DTYPES, "Shipper Site"
+    )
 
 def load_shipper_site_dataframe(shipper_site_file) -> pd.DataFrame:
     """
     Loads the Shipper Site xls file into a pandas dataframe and returns it.
+    If the file is given as a path, the loaded dataframe is cached, so building the virtual import board
+    for several MAWB files against the same Shipper Site file only reads it once.
+    Only reading the file is cached. The dataframe is still processed and indexed by Job Number
+    in create_virtual_import_board_dataframe, as that function receives dataframes which cannot be cached safely.
 
     Parameters
     ----------
@@ -140,8 +414,28 @@ def load_shipper_site_dataframe(shipper_site_file) -> pd.DataFrame:
     -------
     pd.DataFrame:
         The Shipper Site xls file as a pandas dataframe.
+
+    Raises
+    ------
+    ValueError:
+        If the file is not a valid Shipper Site file.
     """
-    return pd.read_excel(shipper_site_file)
+
+    # Only paths can be cached, as file objects have no stable identity or modification time.
+    if isinstance(shipper_site_file, (str, os.PathLike)):
+        shipper_site_path = os.path.abspath(shipper_site_file)
+
+        # Copying a file while keeping its modification time does not change it, so the inode and size
+        # are part of the key as well.
+        stat = os.stat(shipper_site_path)
+        shipper_site_df = _read_shipper_site_file(shipper_site_path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        # Return a copy, so changes made by the caller do not end up in the cache.
+        return shipper_site_df.copy()
+
+    return _read_excel_columns(
+        shipper_site_file, _SHIPPER_SITE_COLUMNS, _SHIPPER_SITE_USECOLS, _SHIPPER_SITE_STRING_DTYPES, "Shipper Site"
+    )
 
 def process_mawb_dataframe(mawb_df: pd.DataFrame, consolidate: bool) -> pd.DataFrame:
     """
@@ -177,69 +471,63 @@ def process_mawb_dataframe(mawb_df: pd.DataFrame, consolidate: bool) -> pd.DataF
         The MAWB xls file as a pandas dataframe.
     """
 
-    # Select the columns that should be loaded into the dataframe
-    # The columns are found inside the MAWB .xls file
-    select = [
-        "Ref: MAWB", 
-        "Ref: Job Number", 
-        "Carrier Rate Carrier Name",
-        "Ref: Flight Arrival", 
-        "Shipper City", 
-        "Shipper State", 
-        "Shipper Postal Code", 
-        "Target Delivery (Early)", 
-        "Consignee Name", 
-        "Consignee City", 
-        "Consignee State", 
-        "Consignee Country"
-    ]
-    mawb_df = mawb_df.loc[:, select]
-
-    # Rename columns
-    mawb_df.rename(columns={
-        "Ref: MAWB": "MAWB", 
-        "Ref: Job Number": "Job Number",
-        "Carrier Rate Carrier Name": "Airline Name",
-        "Ref: Flight Arrival": "Flight Arrival",
-        "Shipper City": "Shipper Airport City",
-        "Shipper State": "Shipper Airport State",
-        "Shipper Postal Code": "Shipper Airport Postal Code",
-        "Target Delivery (Early)": "Target Delivery Airport",
-        "Consignee Name": "Consignee Airport Name",
-        "Consignee City": "Consignee Airport City",
-        "Consignee State": "Consignee Airport State",
-        "Consignee Country": "Consignee Airport Country"
-    }, inplace=True)
+    # Select the columns in the order of the processed dataframe and rename them.
+    # Assigning the new labels directly does not copy the column data again, unlike rename or set_axis
+    # on pandas without Copy-on-Write.
+    mawb_df = mawb_df.loc[:, list(_MAWB_USECOLS)]
+    mawb_df.columns = list(_MAWB_RENAME.values())
 
     # Drop rows where "Ref: MAWB" is empty or contains no data
     mawb_df.dropna(subset=["MAWB"], inplace=True)
 
-    # Copy all rows where "Ref: Job Number" contains multiple Job Numbers if consolidate is False
-    # Print a warning if consolidate is True, as this is not very useful (?)
-    if not consolidate:
-        mawb_df["Job Number"] = mawb_df["Job Number"].str.split(",").apply(lambda x: [item.strip() for item in x])
-        mawb_df = mawb_df.explode("Job Number", ignore_index=True)
-    else:
-        print("WARNING: Consolidation is enabled. Rows that contain multiple Job Numbers are not copied.")
+    # The following corrections only depend on the row itself, so they are applied before the rows
+    # are copied for each Job Number to keep the number of processed rows small.
 
     # Correct the state columns. Only state codes with a length of 2 are valid.
     # All other values are set to None.
+    # Non-string values yield NaN for str.len(), so the mask is False for them.
+    # Columns without any text cannot contain a valid state code at all.
     columns_to_check_state = ["Shipper Airport State", "Consignee Airport State"]
-    mawb_df[columns_to_check_state] = mawb_df[columns_to_check_state].map(
-        lambda item: item if isinstance(item, str) and len(item) == 2 else None
-    )
+    for column in columns_to_check_state:
+        state = mawb_df[column]
+        if not _has_text_dtype(state):
+            mawb_df[column] = None
+            continue
+        mawb_df[column] = state.where(state.str.len().eq(2), other=None)
 
     # Capitalize the first letter of each word in the "Consignee Airport Name" and "Shipper Airport City" column
     columns_to_title = ["Shipper Airport City", "Consignee Airport Name", "Consignee Airport City", "Airline Name"]
-    mawb_df[columns_to_title] = mawb_df[columns_to_title].map(lambda x: x.title() if isinstance(x, str) else x)
+    for column in columns_to_title:
+        mawb_df[column] = _title_case(mawb_df[column])
 
     # Compute the desired MAWB format
     # We want the MAWB to consist of the first three letters, a dash, and the last eight letters.
     # Use vectorized string slicing and concatenation to accelerate the process.
     # Check if the MAWB is 11 characters long to prevent errors (8 + 3 = 11).
-    mawb_df.loc[mawb_df["MAWB"].notna() & (mawb_df["MAWB"].str.len() == 11), "MAWB"] = (
-        mawb_df["MAWB"].str[:3] + "-" + mawb_df["MAWB"].str[-8:]
-    )
+    mawb = mawb_df["MAWB"]
+    formatted_mawb = mawb.str[:3].str.cat(mawb.str[-8:], sep="-")
+    mawb_df["MAWB"] = formatted_mawb.where(mawb.str.len().eq(11), mawb)
+
+    # Copy all rows where "Ref: Job Number" contains multiple Job Numbers if consolidate is False
+    # Log a warning if consolidate is True, as this is not very useful (?)
+    if not consolidate:
+        # Splitting Arrow backed strings through the ArrowDtype yields a contiguous list<string> array,
+        # which explode can flatten without creating a Python list per row.
+        job_numbers = mawb_df["Job Number"]
+        is_arrow_string = _ARROW_STRING_DTYPE is not None and job_numbers.dtype == _STRING_DTYPE
+        # The Arrow split kernel compiles the pattern itself and does not accept a compiled re.Pattern.
+        split_pattern = _JOB_NUMBER_SPLIT
+        if is_arrow_string:
+            job_numbers = job_numbers.astype(_ARROW_STRING_DTYPE)
+            split_pattern = _JOB_NUMBER_SPLIT.pattern
+
+        # Strip the outer whitespace, then split on the comma and its surrounding whitespace in one go.
+        mawb_df["Job Number"] = job_numbers.str.strip().str.split(split_pattern, regex=True)
+        mawb_df = mawb_df.explode("Job Number", ignore_index=True)
+        if is_arrow_string:
+            mawb_df["Job Number"] = mawb_df["Job Number"].astype(_STRING_DTYPE)
+    else:
+        logger.warning("Consolidation is enabled. Rows that contain multiple Job Numbers are not copied.")
 
     return mawb_df
 
@@ -266,29 +554,11 @@ def process_shipper_site_dataframe(shipper_site_df: pd.DataFrame) -> pd.DataFram
     pd.DataFrame:
         The Shipper Site xls file as a pandas dataframe.
     """
-    select = [
-        "Load #",
-        "Ref: House Waybill Number",
-        "Ref: Temperature Range",
-        "ActPlan: Act Plan: Qualification Time",
-        "Actual Ship Unit Quantity",
-        "Actual Ship Unit Weight",
-        "Target Delivery (Range)",
-        "Consignee City",
-    ]
-    shipper_site_df = shipper_site_df.loc[:, select]
-    shipper_site_df.rename(columns={
-        "Load #": "Job Number", 
-        "Ref: House Waybill Number": "House Waybill Number", 
-        "Ref: Temperature Range": "Temperature Range",
-        "ActPlan: Act Plan: Qualification Time": "Qualification Time",
-        "Actual Ship Unit Quantity": "Ship Unit Quantity",
-        "Actual Ship Unit Weight": "Ship Unit Weight",
-        "Target Delivery (Range)": "Target Delivery Consignee",
-    }, inplace=True)
+    shipper_site_df = shipper_site_df.loc[:, list(_SHIPPER_SITE_USECOLS)]
+    shipper_site_df.columns = list(_SHIPPER_SITE_RENAME.values())
 
     # Capitalize the first letter of each word in the "Consignee City" column.
-    shipper_site_df["Consignee City"] = shipper_site_df["Consignee City"].apply(lambda x: x.title() if isinstance(x, str) else x)
+    shipper_site_df["Consignee City"] = _title_case(shipper_site_df["Consignee City"])
 
     return shipper_site_df
     
@@ -313,7 +583,8 @@ def create_virtual_import_board_dataframe(mawb_df: pd.DataFrame, shipper_site_df
 
     # Process the dataframes
     mawb_df = process_mawb_dataframe(mawb_df, consolidate)
-    shipper_site_df = process_shipper_site_dataframe(shipper_site_df)
+    shipper_site_df = process_shipper_site_dataframe(shipper_site_df).set_index("Job Number")
 
-    vib_df = pd.merge(mawb_df, shipper_site_df, left_on="Job Number", right_on="Job Number", how="inner")
-    return vib_df
\ No newline at end of file
+    # Join against the Shipper Site dataframe indexed by Job Number, so only one side needs to be hashed.
+    vib_df = mawb_df.join(shipper_site_df, on="Job Number", how="inner").reset_index(drop=True)
+    return vib_df